@@ -121,7 +121,11 @@ AUTH_PASSWORD_VALIDATORS = [
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
-    'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend']
+    'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    'DEFAULT_RENDERER_CLASSES': [
+        'menu_hierarchy.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 
@@ -154,6 +158,28 @@ STATIC_URL = 'static/'
 
 #DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# The tree cache must be shared between the web and Celery worker processes,
+# or the post-cascade invalidation in tasks.py can never reach the process
+# holding the cached tree. Use Redis whenever REDIS_URL is configured (any
+# deploy running the Procfile worker); development and tests fall back to
+# Django's default per-process LocMem cache.
+if 'REDIS_URL' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+
+# Celery
+# Heavy subtree recomputations run on the worker. The eager default follows
+# DEBUG: development and tests run tasks inline with no broker, while a
+# DEBUG=False deploy dispatches to the Procfile's worker. Set
+# CELERY_TASK_ALWAYS_EAGER explicitly to override either way.
+CELERY_BROKER_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = os.environ.get('CELERY_TASK_ALWAYS_EAGER', str(DEBUG)) == 'True'
+
 CORS_ORIGIN_ALLOW_ALL = True
 
 CORS_ALLOWED_ORIGINS = [
@@ -6,27 +6,33 @@ from faker import Faker
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "assesment_api.settings")
 django.setup()
 
-from menu_hierarchy.models import MenuItem
+from django.db import transaction
+from menu_hierarchy.models import MenuItem, uuid7
 
 fake = Faker()
 
 def create_menu_items(num_items=50):
-    root = MenuItem.objects.create(name="Root Menu")
-    print(f"Created root item: {root.name}")
-
+    # Build the whole tree in memory first; assigning ids up front lets the
+    # parent FKs resolve before anything is inserted.
+    root = MenuItem(id=uuid7(), name="Root Menu", depth=0)
     items = [root]
 
     for i in range(1, num_items):
         parent = random.choice(items)
-        
-        item = MenuItem.objects.create(
+
+        item = MenuItem(
+            id=uuid7(),
             name=fake.unique.word().capitalize(),
-            parent=parent
+            parent=parent,
+            depth=parent.depth + 1,
+            root=root,
         )
         items.append(item)
-        print(f"Created item: {item.name} (Parent: {item.parent.name}, Depth: {item.depth})")
 
-    print(f"\nCreated {num_items} menu items (including root).")
+    with transaction.atomic():
+        MenuItem.objects.bulk_create(items, batch_size=1000)
+
+    print(f"Created {num_items} menu items (including root).")
 
     print("\nMenu Hierarchy:")
     print_hierarchy(root)
@@ -37,4 +43,4 @@ def print_hierarchy(item, level=0):
         print_hierarchy(child, level + 1)
 
 if __name__ == "__main__":
-    create_menu_items()
\ No newline at end of file
+    create_menu_items()
@@ -3,6 +3,7 @@ from .models import MenuItem
 
 class MenuItemAdmin(admin.ModelAdmin):
     list_display = ('name', 'depth', 'parent_name', 'created_at', 'updated_at')
+    list_select_related = ('parent',)
     list_filter = ('depth', 'created_at', 'updated_at')
     search_fields = ('name', 'parent__name')
     date_hierarchy = 'created_at'
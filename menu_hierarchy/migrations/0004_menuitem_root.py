@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-08-31 00:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_hierarchy', '0003_alter_menuitem_created_at_alter_menuitem_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menuitem',
+            name='root',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='menu_hierarchy.menuitem'),
+        ),
+    ]
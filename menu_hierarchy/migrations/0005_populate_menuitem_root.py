@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def populate_root(apps, schema_editor):
+    MenuItem = apps.get_model('menu_hierarchy', 'MenuItem')
+    parent_by_id = dict(MenuItem.objects.values_list('id', 'parent_id'))
+
+    items = []
+    for item_id, parent_id in parent_by_id.items():
+        if parent_id is None:
+            continue
+        root_id = parent_id
+        while parent_by_id[root_id] is not None:
+            root_id = parent_by_id[root_id]
+        items.append(MenuItem(id=item_id, root_id=root_id))
+    MenuItem.objects.bulk_update(items, ['root'], batch_size=1000)
+
+
+def clear_root(apps, schema_editor):
+    MenuItem = apps.get_model('menu_hierarchy', 'MenuItem')
+    MenuItem.objects.update(root=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_hierarchy', '0004_menuitem_root'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_root, clear_root),
+    ]
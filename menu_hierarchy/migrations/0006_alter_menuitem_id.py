@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-08-31 01:01
+
+import menu_hierarchy.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_hierarchy', '0005_populate_menuitem_root'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='menuitem',
+            name='id',
+            field=models.UUIDField(default=menu_hierarchy.models.uuid7, editable=False, primary_key=True, serialize=False, verbose_name='ID'),
+        ),
+    ]
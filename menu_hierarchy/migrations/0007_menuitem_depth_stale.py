@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-08-31 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_hierarchy', '0006_alter_menuitem_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menuitem',
+            name='depth_stale',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-08-31 01:15
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_hierarchy', '0007_menuitem_depth_stale'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='menuitem',
+            options={'ordering': ['id']},
+        ),
+    ]
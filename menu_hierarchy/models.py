@@ -1,39 +1,104 @@
 import uuid
-from django.db import models
-from django.core.exceptions import ValidationError
+
+import uuid_utils
+from django.db import connection, models, transaction
+
+
+def uuid7():
+    """
+    Time-ordered UUIDv7 for primary keys. New ids sort after existing ones,
+    so B-tree inserts append to the rightmost leaf instead of landing on a
+    random page the way uuid4 does. Wrapped in a stdlib UUID because Django's
+    UUIDField doesn't accept uuid_utils' own UUID type.
+    """
+    return uuid.UUID(bytes=uuid_utils.uuid7().bytes)
+
 
 class MenuItem(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, verbose_name='ID')
-    name = models.CharField(max_length=255, unique=True, db_index=True)
-    parent = models.ForeignKey('self', on_delete=models.CASCADE, related_name='children', null=True, blank=True, db_index=True)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False, verbose_name='ID')
+    # The unique constraint on name and the composite indexes below already
+    # cover single-column lookups on name, parent and created_at, so those
+    # fields don't need their own db_index.
+    name = models.CharField(max_length=255, unique=True)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, related_name='children', null=True, blank=True, db_index=False)
+    # Denormalized pointer to the tree root (null for top-level items), kept
+    # in sync by save(); makes root lookup and whole-tree queries O(1).
+    root = models.ForeignKey('self', on_delete=models.CASCADE, related_name='+', null=True, blank=True, editable=False)
     depth = models.IntegerField(default=0, db_index=True)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # True while a reparent's subtree cascade is still queued on the worker;
+    # lets reads flag that depths under this item may be mid-recomputation.
+    depth_stale = models.BooleanField(default=False, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # Deterministic page boundaries for the paginated list; UUIDv7 pks
+        # are time-ordered, so this is creation order straight off the PK
+        # index with no extra sort.
+        ordering = ['id']
         indexes = [
             models.Index(fields=['name', 'depth']),
             models.Index(fields=['parent', 'depth']),
             models.Index(fields=['created_at', 'updated_at']),
         ]
 
-    def clean(self):
-        if MenuItem.objects.filter(name=self.name).exclude(pk=self.pk).exists():
-            raise ValidationError({'name': 'A menu item with this name already exists.'})
+    def __init__(self, *args, **kwargs):
+        super(MenuItem, self).__init__(*args, **kwargs)
+        # Snapshot for save() so the depth/root cascade only runs when the
+        # item actually moved, without re-reading the row from the DB.
+        self._orig_parent_id = self.parent_id
+        self._orig_depth = self.depth
 
-    
-    def update_children_depth(self):
-        for child in self.children.all():
-            child.depth = self.depth + 1
-            child.save()
+    def update_subtree(self, depth_delta):
+        """
+        Shift `depth` by `depth_delta` and repoint `root` for every descendant
+        with one recursive-CTE UPDATE, instead of saving each child (and its
+        subtree) individually. `UNION` (not `UNION ALL`) guarantees the CTE
+        terminates even if bad data ever introduces a parent cycle.
+        """
+        table = self._meta.db_table
+        prep = self._meta.pk.get_db_prep_value
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} SET depth = depth + %s, root_id = %s WHERE id IN (
+                    WITH RECURSIVE sub(id) AS (
+                        SELECT id FROM {table} WHERE parent_id = %s
+                        UNION
+                        SELECT m.id FROM {table} m JOIN sub ON m.parent_id = sub.id
+                    )
+                    SELECT id FROM sub
+                )
+                """,
+                [depth_delta, prep(self.root_id or self.pk, connection), prep(self.pk, connection)]
+            )
 
     def save(self, *args, **kwargs):
         if self.parent:
             self.depth = self.parent.depth + 1
+            self.root = self.parent.root if self.parent.root_id else self.parent
         else:
             self.depth = 0
+            self.root = None
+        is_new = self._state.adding
+        needs_cascade = not is_new and (
+            self.parent_id != self._orig_parent_id or self.depth != self._orig_depth
+        )
+        if needs_cascade:
+            # Marked until the worker finishes so reads can tell the
+            # subtree's depths are mid-recomputation.
+            self.depth_stale = True
         super(MenuItem, self).save(*args, **kwargs)
-        self.update_children_depth()
+        if needs_cascade:
+            from .tasks import recompute_subtree
+            depth_delta = self.depth - self._orig_depth
+            # Enqueue after commit so the worker sees the new parent row;
+            # runs inline when CELERY_TASK_ALWAYS_EAGER is set.
+            transaction.on_commit(
+                lambda: recompute_subtree.delay(str(self.pk), depth_delta)
+            )
+        self._orig_parent_id = self.parent_id
+        self._orig_depth = self.depth
     
     def parent_name(self):
         return self.parent.name if self.parent else None
@@ -1,25 +1,59 @@
 from rest_framework import serializers
 from .models import MenuItem
 
+
+def serialize_menu_item(obj):
+    """
+    Build the read representation of a `MenuItem` as a plain dict.
+
+    Used on the hot GET paths instead of `MenuItemSerializer`, which pays
+    per-field binding overhead on every row; the ModelSerializer is kept
+    for writes, where its validation matters.
+    """
+    return {
+        'id': str(obj.id),
+        'name': obj.name,
+        'parent_name': obj.parent.name if obj.parent_id else None,
+        'depth': obj.depth,
+        'depth_stale': obj.depth_stale,
+        'created_at': obj.created_at.isoformat(),
+        'updated_at': obj.updated_at.isoformat(),
+    }
+
+
 class MenuItemSerializer(serializers.ModelSerializer):
     parent = serializers.PrimaryKeyRelatedField(
         queryset=MenuItem.objects.all(),
         required=False,
-        allow_null=True
+        allow_null=True,
+        write_only=True
     )
+    parent_name = serializers.CharField(source='parent.name', read_only=True, default=None)
 
     class Meta:
         model = MenuItem
-        fields = ['id', 'name', 'parent', 'depth', 'created_at', 'updated_at']
-        read_only_fields = ['depth', 'created_at', 'updated_at']
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['parent'] = instance.parent.name if instance.parent else None
-        return representation
+        fields = ['id', 'name', 'parent', 'parent_name', 'depth', 'depth_stale', 'created_at', 'updated_at']
+        read_only_fields = ['depth', 'depth_stale', 'created_at', 'updated_at']
+        # Uniqueness of name is enforced by the DB constraint; skip the
+        # extra existence query DRF's UniqueValidator would run per write.
+        extra_kwargs = {'name': {'validators': []}}
 
-    def validate_name(self, value):
-        instance = getattr(self, 'instance', None)
-        if MenuItem.objects.filter(name=value).exclude(pk=instance.pk if instance else None).exists():
-            raise serializers.ValidationError("A menu item with this name already exists.")
+    def validate_parent(self, value):
+        """
+        Reject parents that would create a cycle: an item can't be its own
+        parent or be moved under one of its descendants. One {id: parent_id}
+        scan makes the ancestor walk query-free.
+        """
+        if value is None or self.instance is None:
+            return value
+        if value.pk == self.instance.pk:
+            raise serializers.ValidationError("A menu item cannot be its own parent.")
+        parent_by_id = dict(MenuItem.objects.values_list('id', 'parent_id'))
+        ancestor_id = parent_by_id.get(value.pk)
+        while ancestor_id is not None:
+            if ancestor_id == self.instance.pk:
+                raise serializers.ValidationError(
+                    "A menu item cannot be moved under one of its own descendants."
+                )
+            ancestor_id = parent_by_id.get(ancestor_id)
         return value
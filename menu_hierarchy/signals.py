@@ -0,0 +1,17 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import MenuItem
+
+TREE_CACHE_KEY = 'menuitem:tree:v1'
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_tree_cache(sender, **kwargs):
+    """
+    Drop the cached tree payload whenever a `MenuItem` changes, so the
+    `tree` endpoint never serves stale hierarchy between writes.
+    """
+    cache.delete(TREE_CACHE_KEY)
@@ -0,0 +1,23 @@
+from celery import shared_task
+from django.core.cache import cache
+
+from .models import MenuItem
+from .signals import TREE_CACHE_KEY
+
+
+@shared_task
+def recompute_subtree(item_id, depth_delta):
+    """
+    Run the depth/root cascade for the subtree under `item_id` out-of-band,
+    so HTTP workers don't block on large reparent operations.
+    """
+    try:
+        item = MenuItem.objects.get(pk=item_id)
+    except MenuItem.DoesNotExist:
+        return
+    item.update_subtree(depth_delta)
+    MenuItem.objects.filter(pk=item_id).update(depth_stale=False)
+    # The cascade is raw SQL and fires no post_save, so a tree cached from
+    # half-updated rows during the queue window would otherwise stick around
+    # forever; invalidate it now that the subtree is consistent.
+    cache.delete(TREE_CACHE_KEY)
@@ -3,6 +3,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 from .models import MenuItem
+import json
 import uuid
 from .serializers import MenuItemSerializer
 
@@ -17,10 +18,9 @@ class MenuItemViewSetTestCase(TestCase):
         url = reverse('menuitem-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('data', response.data)
-        self.assertIn('hierarchy_tree', response.data)
-        self.assertEqual(len(response.data['data']), 4)
-        self.assertEqual(len(response.data['hierarchy_tree']), 1)
+        self.assertIn('results', response.data)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 3)
 
     def test_retrieve_menu_item(self):
         url = reverse('menuitem-detail', kwargs={'pk': self.child_item.pk})
@@ -56,8 +56,8 @@ class MenuItemViewSetTestCase(TestCase):
     def test_delete_menu_item_with_children(self):
         url = reverse('menuitem-detail', kwargs={'pk': self.root_item.pk})
         response = self.client.delete(url)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('error', response.data)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(MenuItem.objects.count(), 0)
 
     def test_delete_menu_item_without_children(self):
         url = reverse('menuitem-detail', kwargs={'pk': self.grandchild_item.pk})
@@ -73,6 +73,33 @@ class MenuItemViewSetTestCase(TestCase):
         self.child_item.refresh_from_db()
         self.assertEqual(self.child_item.name, 'Updated Child')
 
+    def test_reparent_menu_item_cascades_to_subtree(self):
+        new_root = MenuItem.objects.create(name="Other Root")
+        branch = MenuItem.objects.create(name="Branch", parent=new_root)
+        url = reverse('menuitem-detail', kwargs={'pk': self.child_item.pk})
+        # on_commit callbacks never fire inside TestCase's transaction, so
+        # capture them to run the enqueued cascade task.
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, {'parent': branch.pk})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['depth'], 2)
+            self.assertTrue(response.data['depth_stale'])
+        self.child_item.refresh_from_db()
+        self.grandchild_item.refresh_from_db()
+        self.assertFalse(self.child_item.depth_stale)
+        self.assertEqual(self.child_item.depth, 2)
+        self.assertEqual(self.child_item.root, new_root)
+        self.assertEqual(self.grandchild_item.depth, 3)
+        self.assertEqual(self.grandchild_item.root, new_root)
+
+    def test_update_menu_item_with_cyclic_parent(self):
+        url = reverse('menuitem-detail', kwargs={'pk': self.child_item.pk})
+        for parent_pk in (self.child_item.pk, self.grandchild_item.pk):
+            response = self.client.patch(url, {'parent': parent_pk})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.child_item.refresh_from_db()
+        self.assertEqual(self.child_item.parent, self.root_item)
+
     def test_get_root_item(self):
         url = reverse('menuitem-detail', kwargs={'pk': self.grandchild_item.pk})
         response = self.client.get(url)
@@ -80,10 +107,10 @@ class MenuItemViewSetTestCase(TestCase):
         self.assertEqual(response.data['root_item'], 'Root')
 
     def test_hierarchical_structure(self):
-        url = reverse('menuitem-list')
+        url = reverse('menuitem-tree')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        hierarchy = response.data['hierarchy_tree']
+        hierarchy = json.loads(response.content)
         self.assertEqual(len(hierarchy), 1)
         self.assertEqual(hierarchy[0]['name'], 'Root')
         self.assertEqual(len(hierarchy[0]['children']), 1)
@@ -0,0 +1,53 @@
+def build_tree(rows):
+    """
+    Assemble the nested hierarchy from depth-descending row dicts.
+
+    This is the CPU hot path for large trees, so it is kept as one flat
+    loop with no closures or per-node function calls: each row adopts its
+    already-built children from `pending` and queues itself under its
+    parent. Rows must arrive deepest-first (ORDER BY depth DESC).
+
+    Args:
+        rows: iterable of dicts with `id`, `name`, `parent_id` and `depth`.
+
+    Returns:
+        tuple: (roots, nodes) — the list of root nodes and an {id: node}
+        map for picking out a subtree.
+    """
+    nodes = {}
+    pending = {}
+    roots = []
+    pending_pop = pending.pop
+    pending_get = pending.get
+    roots_append = roots.append
+
+    for row in rows:
+        item_id = row['id']
+        name = row['name']
+        parent_id = row['parent_id']
+
+        children = pending_pop(item_id, None)
+        if children is None:
+            children = []
+        else:
+            for child in children:
+                child['parent'] = name
+
+        node = {
+            'id': item_id,
+            'name': name,
+            'parent': None,
+            'depth': row['depth'],
+            'children': children
+        }
+        nodes[item_id] = node
+        if parent_id is None:
+            roots_append(node)
+        else:
+            bucket = pending_get(parent_id)
+            if bucket is None:
+                pending[parent_id] = [node]
+            else:
+                bucket.append(node)
+
+    return roots, nodes
@@ -1,10 +1,16 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+import orjson
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from rest_framework.exceptions import ValidationError as DRFValidationError
 from .models import MenuItem
-from .serializers import MenuItemSerializer
+from .serializers import MenuItemSerializer, serialize_menu_item
+from .signals import TREE_CACHE_KEY
+from .tree_builder import build_tree
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -15,10 +21,11 @@ class MenuItemViewSet(viewsets.ModelViewSet):
     Actions:
         - `retrieve`: Get details of a specific `MenuItem`, including its depth and root item.
         - `create`: Create a new `MenuItem`, with depth calculated based on its parent item.
-        - `list`: List all `MenuItem` objects with hierarchical structure.
-        - `destroy`: Delete a specific `MenuItem`, ensuring it does not have any children.
+        - `list`: List `MenuItem` objects as a flat, paginated collection.
+        - `tree`: Return the full hierarchy as a nested tree (cached between writes).
+        - `destroy`: Delete a specific `MenuItem` along with all of its descendants.
     """
-    queryset = MenuItem.objects.all()
+    queryset = MenuItem.objects.select_related('parent', 'root')
     serializer_class = MenuItemSerializer
 
     def get_menu_item_schema():
@@ -40,9 +47,8 @@ class MenuItemViewSet(viewsets.ModelViewSet):
     )
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
         return Response({
-            'data': serializer.data,
+            'data': serialize_menu_item(instance),
             'depth': instance.depth,
             'root_item': self.get_root_item(instance),
             'hierarchy_tree': self.get_hierarchical_structure(instance)
@@ -50,7 +56,7 @@ class MenuItemViewSet(viewsets.ModelViewSet):
 
     def get_root_item(self, item):
         """
-        Recursively find the root item of the given `MenuItem`.
+        Find the root item of the given `MenuItem`.
 
         Args:
             item (MenuItem): The `MenuItem` instance whose root is to be found.
@@ -58,9 +64,7 @@ class MenuItemViewSet(viewsets.ModelViewSet):
         Returns:
             str: The name of the root `MenuItem`.
         """
-        while item.parent:
-            item = item.parent
-        return item.name
+        return item.root.name if item.root_id else item.name
 
     @swagger_auto_schema(
         request_body=MenuItemSerializer,
@@ -131,79 +135,90 @@ class MenuItemViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         try:
             serializer.save()
-        except ValidationError as e:
-            raise ValidationError(str(e))
+        except IntegrityError:
+            raise DRFValidationError({'name': 'A menu item with this name already exists.'})
 
     def perform_update(self, serializer):
         try:
             serializer.save()
-        except ValidationError as e:
-            raise ValidationError(str(e))
+        except IntegrityError:
+            raise DRFValidationError({'name': 'A menu item with this name already exists.'})
+
+    @swagger_auto_schema(
+        responses={200: openapi.Response('Success', schema=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=get_menu_item_schema()
+        ))},
+        operation_description="List `MenuItem` instances as a flat, paginated collection."
+    )
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([serialize_menu_item(obj) for obj in page])
+        return Response([serialize_menu_item(obj) for obj in queryset])
 
     @swagger_auto_schema(
         responses={
             200: openapi.Response('Success', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'data': openapi.Schema(
-                        type=openapi.TYPE_ARRAY,
-                        items=get_menu_item_schema()
-                    ),
-                    'hierarchy_tree': openapi.Schema(
-                        type=openapi.TYPE_ARRAY,
-                        items=openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                'id': openapi.Schema(type=openapi.TYPE_INTEGER),
-                                'name': openapi.Schema(type=openapi.TYPE_STRING),
-                                'depth': openapi.Schema(type=openapi.TYPE_INTEGER),
-                                'children': openapi.Schema(
-                                    type=openapi.TYPE_ARRAY,
-                                    items=openapi.Schema(type=openapi.TYPE_OBJECT)
-                                )
-                            }
+                type=openapi.TYPE_ARRAY,
+                items=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'id': openapi.Schema(type=openapi.TYPE_STRING),
+                        'name': openapi.Schema(type=openapi.TYPE_STRING),
+                        'parent': openapi.Schema(type=openapi.TYPE_STRING, nullable=True),
+                        'depth': openapi.Schema(type=openapi.TYPE_INTEGER),
+                        'children': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT)
                         )
-                    )
-                }
+                    }
+                )
             ))
         },
-        operation_description="List all `MenuItem` instances with hierarchical structure."
+        operation_description="Return the full hierarchy of `MenuItem` instances as a nested tree."
     )
-    def list(self, request, *args, **kwargs):
-        response = super(MenuItemViewSet, self).list(request, *args, **kwargs)
-        return Response({
-            'data': response.data,
-            'hierarchy_tree': self.get_hierarchical_structure()
-        })
+    @action(detail=False, methods=['get'], url_path='tree')
+    def tree(self, request):
+        cached = cache.get(TREE_CACHE_KEY)
+        if cached is None:
+            cached = orjson.dumps(
+                self.get_hierarchical_structure(),
+                option=orjson.OPT_NAIVE_UTC,
+                default=str
+            )
+            # Finite timeout as a backstop: on a per-process cache (no
+            # REDIS_URL) cross-process invalidation can't reach this entry.
+            cache.set(TREE_CACHE_KEY, cached, timeout=300)
+        # Serve the pre-rendered bytes directly, skipping the DRF
+        # renderer chain on cache hits.
+        return HttpResponse(cached, content_type='application/json')
 
     def get_hierarchical_structure(self, root_item=None):
         """
         Build a hierarchical structure of `MenuItem` instances, including the root item if provided.
 
+        Fetches every item in a single query and assembles the tree in Python,
+        instead of issuing one query per node.
+
         Args:
             root_item (MenuItem, optional): The root item to start building the structure from.
 
         Returns:
             list: A nested list representing the hierarchical structure of `MenuItem` objects.
         """
-        def build_tree(item):
-            tree = {
-                'id': item.id,
-                'name': item.name,
-                'parent': item.parent.name if item.parent is not None else None,
-                'depth': item.depth,
-                'children': []
-            }
-            children = MenuItem.objects.filter(parent=item)
-            for child in children:
-                tree['children'].append(build_tree(child))
-            return tree
+        # .values() skips model instantiation and .iterator() streams rows in
+        # chunks instead of caching the whole result set on the queryset.
+        rows = MenuItem.objects.order_by('-depth').values(
+            'id', 'name', 'parent_id', 'depth'
+        ).iterator(chunk_size=2000)
 
+        roots, nodes = build_tree(rows)
         if root_item is None:
-            top_level_items = MenuItem.objects.filter(parent__isnull=True)
-            return [build_tree(item) for item in top_level_items]
-        else:
-            return [build_tree(root_item)]
+            return roots
+        node = nodes.get(root_item.id)
+        return [node] if node is not None else []
 
     @swagger_auto_schema(
         responses={
@@ -216,17 +231,9 @@ class MenuItemViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         try:
             with transaction.atomic():
-                self._delete_children(instance)
+                # parent uses on_delete=CASCADE, so this removes the whole
+                # subtree without recursing in Python.
                 instance.delete()
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def _delete_children(self, item):
-        """
-        Recursively delete all children of the given item.
-        """
-        children = item.children.all()
-        for child in children:
-            self._delete_children(child)
-            child.delete()